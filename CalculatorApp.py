@@ -12,14 +12,20 @@ python
 # Run locally with: streamlit run streamlit_calculator.py
 
 import ast
+import collections
+import functools
+import itertools
 import math
 import operator as op
+import re
+import types
+from array import array
 import streamlit as st
 
 # -------------------------
 # Safe evaluator (AST-based)
 # -------------------------
-# Whitelisted operators and functions
+# Whitelisted operators and functions ('^' is rewritten to '**' before parsing)
 _OPERATORS = {
     ast.Add: op.add,
     ast.Sub: op.sub,
@@ -30,7 +36,6 @@ _OPERATORS = {
     ast.FloorDiv: op.floordiv,
     ast.USub: op.neg,
     ast.UAdd: op.pos,
-    ast.BitXor: op.pow,  # allow ^ as power (handled by parsing replacement)
 }
 
 _MATH_FUNCS = {
@@ -48,7 +53,9 @@ _MATH_FUNCS = {
     "abs": abs,
     "ceil": math.ceil,
     "floor": math.floor,
-    "factorial": math.factorial,
+    # memoized across evaluations: factorial is O(n) bignum work. typed=True keeps
+    # factorial(5) and factorial(5.0) apart, since the latter must still raise.
+    "factorial": functools.lru_cache(maxsize=1024, typed=True)(math.factorial),
 }
 
 _CONSTANTS = {
@@ -59,68 +66,296 @@ _CONSTANTS = {
     "nan": math.nan,
 }
 
-_ALLOWED_NAMES = {**_MATH_FUNCS, **_CONSTANTS}
+# Every name an expression may reference, merged once and read-only
+_ALLOWED_NAMES = types.MappingProxyType({**_MATH_FUNCS, **_CONSTANTS})
+
+# Node types permitted in a parsed expression. ast.walk also yields the operator
+# and context nodes, so those are listed alongside the expression nodes.
+_ALLOWED_NODE_TYPES = (
+    ast.Expression, ast.BinOp, ast.UnaryOp, ast.Load,
+    ast.Call, ast.Name, ast.Constant, ast.Tuple, ast.Pow, ast.Mod,
+    ast.FloorDiv, ast.Add, ast.Sub, ast.Mult, ast.Div, ast.USub, ast.UAdd,
+)
+_ALLOWED_OP_TYPES = frozenset(_OPERATORS)
+
+# Suspicious tokens, matched in a single pass over the input
+_FORBIDDEN_RE = re.compile(r";|__|\b(?:import|exec|eval|subprocess)\b|os\.|sys\.")
+
+# Inputs made only of digits, arithmetic operators and parentheses
+_NUM_EXPR_RE = re.compile(r"[\d\s+\-*/().%]+")
 
 class EvalError(Exception):
     pass
 
-def _eval_ast(node):
-    """Recursively evaluate an AST node using the safe whitelist."""
-    if isinstance(node, ast.Expression):
-        return _eval_ast(node.body)
+# What arithmetic and math functions raise on bad input (OverflowError and
+# ZeroDivisionError are ArithmeticErrors); translated to EvalError in one place
+_EVAL_ERRORS = (ArithmeticError, ValueError, TypeError)
+
+# Literal and folded value types the evaluator accepts (complex literals like 2j
+# included, matching results such as (-1)**0.5)
+_NUMBER_TYPES = (int, float, complex)
+
+# Opcodes for the small stack VM that runs compiled expressions. Each
+# instruction is one opcode byte plus one operand in the parallel args array.
+PUSH_CONST = 0      # operand: index into consts
+BINARY_OP = 1       # operand: index into _OP_FUNCS
+UNARY_OP = 2        # operand: index into _OP_FUNCS
+CALL = 3            # operand: argument count; the function is pushed before its arguments
+BUILD_TUPLE = 4     # operand: element count
+
+# Dense operator table: the compiler resolves each AST operator to an index
+# once, and the VM calls _OP_FUNCS[index] without hashing a type object.
+_OP_INDEX = {
+    ast.Add: 0,
+    ast.Sub: 1,
+    ast.Mult: 2,
+    ast.Div: 3,
+    ast.Pow: 4,
+    ast.Mod: 5,
+    ast.FloorDiv: 6,
+    ast.USub: 7,
+    ast.UAdd: 8,
+}
+_OP_FUNCS = tuple(_OPERATORS[op_type] for op_type in _OP_INDEX)
+
+def _emit(opcode, arg, ops, args):
+    ops.append(opcode)
+    args.append(arg)
+
+def _emit_const(value, ops, args, consts):
+    _emit(PUSH_CONST, len(consts), ops, args)
+    consts.append(value)
+
+# Compile handlers, one per AST node type. A handler emits whatever precedes its
+# children, then pushes onto the work stack its own trailing (opcode, arg)
+# instruction followed by its children in reverse, so they pop in source order.
 
-    if isinstance(node, ast.Num):  # Python <3.8
-        return node.n
-    if hasattr(ast, "Constant") and isinstance(node, ast.Constant):  # py3.8+
-        if isinstance(node.value, (int, float)):
-            return node.value
+def _compile_expression(node, work, ops, args, consts):
+    work.append(node.body)
+
+def _compile_constant(node, work, ops, args, consts):
+    if not isinstance(node.value, _NUMBER_TYPES):
         raise EvalError(f"Unsupported constant type: {type(node.value).__name__}")
+    _emit_const(node.value, ops, args, consts)
 
-    if isinstance(node, ast.BinOp):
-        left = _eval_ast(node.left)
-        right = _eval_ast(node.right)
-        op_type = type(node.op)
-        if op_type in _OPERATORS:
-            func = _OPERATORS[op_type]
-            try:
-                return func(left, right)
-            except Exception as e:
-                raise EvalError(str(e))
+def _compile_binop(node, work, ops, args, consts):
+    op_type = type(node.op)
+    if op_type not in _OP_INDEX:
         raise EvalError(f"Unsupported binary operator: {op_type.__name__}")
+    work.append((BINARY_OP, _OP_INDEX[op_type]))
+    work.append(node.right)
+    work.append(node.left)
 
-    if isinstance(node, ast.UnaryOp):
-        operand = _eval_ast(node.operand)
-        op_type = type(node.op)
-        if op_type in _OPERATORS:
-            func = _OPERATORS[op_type]
-            try:
-                return func(operand)
-            except Exception as e:
-                raise EvalError(str(e))
+def _compile_unaryop(node, work, ops, args, consts):
+    op_type = type(node.op)
+    if op_type not in _OP_INDEX:
         raise EvalError(f"Unsupported unary operator: {op_type.__name__}")
+    work.append((UNARY_OP, _OP_INDEX[op_type]))
+    work.append(node.operand)
 
-    if isinstance(node, ast.Call):
-        if isinstance(node.func, ast.Name):
-            fname = node.func.id
-            if fname not in _MATH_FUNCS:
-                raise EvalError(f"Function '{fname}' not allowed")
-            func = _MATH_FUNCS[fname]
-            args = [_eval_ast(a) for a in node.args]
-            try:
-                return func(*args)
-            except Exception as e:
-                raise EvalError(str(e))
+def _compile_call(node, work, ops, args, consts):
+    if not isinstance(node.func, ast.Name):
         raise EvalError("Only direct math function calls are allowed")
-
-    if isinstance(node, ast.Name):
-        if node.id in _CONSTANTS:
-            return _CONSTANTS[node.id]
+    fname = node.func.id
+    if fname not in _MATH_FUNCS:
+        raise EvalError(f"Function '{fname}' not allowed")
+    _emit_const(_MATH_FUNCS[fname], ops, args, consts)
+    work.append((CALL, len(node.args)))
+    work.extend(reversed(node.args))
+
+def _compile_name(node, work, ops, args, consts):
+    if node.id not in _CONSTANTS:
         raise EvalError(f"Name '{node.id}' is not allowed")
+    _emit_const(_CONSTANTS[node.id], ops, args, consts)
+
+def _compile_tuple(node, work, ops, args, consts):
+    work.append((BUILD_TUPLE, len(node.elts)))
+    work.extend(reversed(node.elts))
+
+# One compile handler per AST node type, looked up by exact type
+_NODE_COMPILERS = {
+    ast.Expression: _compile_expression,
+    ast.Constant: _compile_constant,
+    ast.BinOp: _compile_binop,
+    ast.UnaryOp: _compile_unaryop,
+    ast.Call: _compile_call,
+    ast.Name: _compile_name,
+    ast.Tuple: _compile_tuple,
+}
+
+def _compile_expr(node):
+    """
+    Compile a validated AST into (ops, args, consts) for _run.
+    Post-order walk with an explicit work stack (no recursion, so deep
+    expressions are not limited by the interpreter's recursion limit):
+    operands are emitted before the opcode that consumes them.
+    Opcodes and operands live in compact C arrays; consts stays a list since it
+    holds callables and arbitrary-precision ints.
+    """
+    ops, args, consts = array("B"), array("I"), []
+    work = [node]
+    while work:
+        item = work.pop()
+        if type(item) is tuple:
+            _emit(item[0], item[1], ops, args)
+            continue
+        handler = _NODE_COMPILERS.get(type(item))
+        if handler is None:
+            raise EvalError(f"Unsupported expression: {type(item).__name__}")
+        handler(item, work, ops, args, consts)
+    return ops, args, consts
+
+def _run(ops, args, consts):
+    """Execute a compiled expression and return the value left on the stack."""
+    stack = []
+    push = stack.append
+    pop = stack.pop
+    for pc in range(len(ops)):
+        opcode = ops[pc]
+        arg = args[pc]
+        if opcode == PUSH_CONST:
+            push(consts[arg])
+        elif opcode == BINARY_OP:
+            b = pop()
+            stack[-1] = _OP_FUNCS[arg](stack[-1], b)
+        elif opcode == UNARY_OP:
+            stack[-1] = _OP_FUNCS[arg](stack[-1])
+        elif opcode == CALL:
+            start = len(stack) - arg
+            call_args = stack[start:]
+            del stack[start:]
+            stack[-1] = stack[-1](*call_args)
+        elif opcode == BUILD_TUPLE:
+            start = len(stack) - arg
+            items = tuple(stack[start:])
+            del stack[start:]
+            push(items)
+    return stack[-1]
+
+def _parse_and_validate(expr: str):
+    """Parse a normalized expression string and check it against the whitelist."""
+    # Pure arithmetic has no names, calls or keywords for the token scan and the
+    # whitelist walk to catch; the compiler still rejects any node it doesn't know.
+    numeric_only = _NUM_EXPR_RE.fullmatch(expr) is not None
+
+    # Reject suspicious characters
+    if not numeric_only and _FORBIDDEN_RE.search(expr):
+        raise EvalError("Invalid token in expression")
 
-    if isinstance(node, ast.Tuple):
-        return tuple(_eval_ast(elt) for elt in node.elts)
+    try:
+        parsed = ast.parse(expr, mode="eval")
+    except Exception as e:
+        raise EvalError(f"Parse error: {e}")
+
+    if numeric_only:
+        return parsed
+
+    # Walk AST to ensure only allowed nodes are present
+    for node in ast.walk(parsed):
+        if not isinstance(node, _ALLOWED_NODE_TYPES):
+            raise EvalError(f"Disallowed AST node: {type(node).__name__}")
+        if type(node) is ast.BinOp and type(node.op) not in _ALLOWED_OP_TYPES:
+            raise EvalError(f"Operator not allowed: {type(node.op).__name__}")
+        # ast.walk yields a Call before its func, so call targets get the
+        # function error rather than the generic name one
+        if type(node) is ast.Call and type(node.func) is ast.Name and node.func.id not in _MATH_FUNCS:
+            raise EvalError(f"Function '{node.func.id}' not allowed")
+        if type(node) is ast.Name and node.id not in _ALLOWED_NAMES:
+            raise EvalError(f"Name '{node.id}' is not allowed")
+
+    return parsed
+
+def _is_number(node):
+    return isinstance(node, ast.Constant) and isinstance(node.value, _NUMBER_TYPES)
+
+# Constant-folding handlers, one per AST node type. Each receives a node whose
+# children are already folded and returns either the node or an ast.Constant.
 
-    raise EvalError(f"Unsupported expression: {type(node).__name__}")
+def _fold_value(node, func, *args):
+    # Subtrees that fail to evaluate are left in place so the error is raised
+    # when the program runs
+    try:
+        value = func(*args)
+    except _EVAL_ERRORS:
+        return node
+    if not isinstance(value, _NUMBER_TYPES):
+        return node
+    return ast.copy_location(ast.Constant(value=value), node)
+
+def _fold_binop(node):
+    if _is_number(node.left) and _is_number(node.right):
+        return _fold_value(node, _OPERATORS[type(node.op)], node.left.value, node.right.value)
+    return node
+
+def _fold_unaryop(node):
+    if _is_number(node.operand):
+        # Signed literals such as -3.5: the sign can't fail on a number, so
+        # fold directly instead of going through _fold_value
+        value = node.operand.value
+        if type(node.op) is ast.USub:
+            return ast.copy_location(ast.Constant(value=-value), node)
+        if type(node.op) is ast.UAdd:
+            return ast.copy_location(ast.Constant(value=+value), node)
+    return node
+
+def _fold_call(node):
+    if (isinstance(node.func, ast.Name) and node.func.id in _MATH_FUNCS
+            and not node.keywords and all(_is_number(arg) for arg in node.args)):
+        return _fold_value(node, _MATH_FUNCS[node.func.id], *(arg.value for arg in node.args))
+    return node
+
+def _fold_name(node):
+    if node.id in _CONSTANTS:
+        return ast.copy_location(ast.Constant(value=_CONSTANTS[node.id]), node)
+    return node
+
+_NODE_FOLDERS = {
+    ast.BinOp: _fold_binop,
+    ast.UnaryOp: _fold_unaryop,
+    ast.Call: _fold_call,
+    ast.Name: _fold_name,
+}
+
+def _fold_constants(tree):
+    """
+    Replace constant subtrees of a validated AST with their value, bottom-up.
+    The calculator has no free variables, so most expressions fold down to a
+    single constant. Iterative, so deep expressions are not limited by the
+    interpreter's recursion limit.
+    """
+    # Pre-order listing with an explicit stack; reversed, every node comes
+    # after its children. A call's func is skipped: it must stay a Name.
+    order = []
+    work = [tree]
+    while work:
+        node = work.pop()
+        order.append(node)
+        if type(node) is ast.Call:
+            work.extend(node.args)
+        else:
+            work.extend(ast.iter_child_nodes(node))
+
+    folded = {}  # id(original node) -> replacement Constant
+    for node in reversed(order):
+        for name, value in ast.iter_fields(node):
+            if isinstance(value, list):
+                value[:] = [folded.get(id(item), item) for item in value]
+            elif id(value) in folded:
+                setattr(node, name, folded[id(value)])
+        handler = _NODE_FOLDERS.get(type(node))
+        if handler is not None:
+            replacement = handler(node)
+            if replacement is not node:
+                folded[id(node)] = replacement
+    return folded.get(id(tree), tree)
+
+@functools.lru_cache(maxsize=256)
+def _compile_cached(expr: str):
+    """
+    Parse, validate, constant-fold and compile a normalized expression string.
+    Cached per string, so re-submitting an expression only runs the VM.
+    """
+    return _compile_expr(_fold_constants(_parse_and_validate(expr)))
 
 def safe_eval(expr: str):
     """
@@ -132,42 +367,46 @@ def safe_eval(expr: str):
     if not expr or not expr.strip():
         raise EvalError("Empty expression")
 
-    # Normalize: allow '^' for power, replace with '**'
-    expr = expr.replace("^", "**")
-
-    # Reject suspicious characters
-    for ch in [';', '__', 'import', 'exec', 'eval', 'os.', 'sys.', 'subprocess']:
-        if ch in expr:
-            raise EvalError("Invalid token in expression")
+    # Normalize: strip surrounding whitespace and allow '^' for power, replace with '**'
+    expr = expr.strip().replace("^", "**")
 
+    ops, args, consts = _compile_cached(expr)
+    # Fully folded program: the cached constant is the result, skip the VM
+    if len(ops) == 1 and ops[0] == PUSH_CONST:
+        return consts[0]
     try:
-        parsed = ast.parse(expr, mode="eval")
-    except Exception as e:
-        raise EvalError(f"Parse error: {e}")
-
-    # Walk AST to ensure only allowed nodes are present
-    for node in ast.walk(parsed):
-        if isinstance(node, ast.BinOp) and type(node.op) not in _OPERATORS:
-            raise EvalError(f"Operator not allowed: {type(node.op).__name__}")
-        # Permit only specific node types
-        if not isinstance(node, (
-            ast.Expression, ast.BinOp, ast.UnaryOp, ast.Num, ast.Load,
-            ast.Call, ast.Name, ast.Constant, ast.Tuple, ast.Pow, ast.Mod,
-            ast.FloorDiv, ast.Add, ast.Sub, ast.Mult, ast.Div, ast.USub, ast.UAdd,
-        )):
-            # Allow operator classes implicitly included above; otherwise reject
-            # (Note: many operator types are subclasses; the checks above catch most)
-            # If running into false positives on a Python version, extend allowed types.
-            allowed = (ast.Expression, ast.BinOp, ast.UnaryOp, ast.Num, ast.Load,
-                       ast.Call, ast.Name, ast.Constant, ast.Tuple)
-            if not isinstance(node, allowed):
-                raise EvalError(f"Disallowed AST node: {type(node).__name__}")
-
-    return _eval_ast(parsed)
+        return _run(ops, args, consts)
+    except _EVAL_ERRORS as e:
+        raise EvalError(str(e))
 
 # -------------------------
 # Streamlit UI
 # -------------------------
+_HISTORY_MAXLEN = 200
+
+# Pad buttons: (label, text appended to the expression) and function openers
+_PAD_OPS = (
+    ("+", "+"), ("-", "-"), ("×", "*"), ("÷", "/"),
+    ("^", "^"), ("%", "%"), ("(", "("), (")", ")"),
+)
+_PAD_FUNCS = ("sin(", "cos(", "tan(", "sqrt(", "log(", "log10(", "exp(", "abs(")
+
+# Reference panel text; the whitelists don't change, so build it once
+_REFERENCE_TEXT = (
+    "You may use numbers, `+ - * / ^ % //` and parentheses. Use math functions like "
+    + ", ".join(sorted(_MATH_FUNCS))
+    + ". Constants: " + ", ".join(sorted(_CONSTANTS))
+)
+
+def _append_to_input(text):
+    st.session_state.expr_input = st.session_state.get("expr_input", "") + text
+
+# Result cache shared across reruns and sessions; safe_eval is pure, and errors
+# are raised rather than cached.
+@st.cache_data(show_spinner=False, max_entries=512)
+def _cached_eval(expr: str):
+    return safe_eval(expr)
+
 st.set_page_config(page_title="Simple Calculator", layout="centered")
 
 st.title("🧮 Simple Calculator")
@@ -175,7 +414,8 @@ st.caption("Safe expression evaluation with math functions. Deploy on share.stre
 
 # Initialize history in session state
 if "history" not in st.session_state:
-    st.session_state.history = []  # list of tuples: (expression, result or error)
+    # newest first: (expression, result or error), capped at _HISTORY_MAXLEN
+    st.session_state.history = collections.deque(maxlen=_HISTORY_MAXLEN)
 
 col_expr, col_buttons = st.columns([3, 1])
 
@@ -190,46 +430,15 @@ with col_expr:
 with col_buttons:
     st.write("")  # spacing
     st.write("")  # spacing
-    if st.button("Calculate"):
-        # We'll handle below outside the column to allow pressing Enter (form not used)
-        pass
-
-# Quick-operation buttons (append to expression)
-ops = [
-    ("+", "+"), ("-", "-"), ("×", "*"), ("÷", "/"),
-    ("^", "^"), ("%", "%"), ("(", "("), (")", ")")
-]
-funcs = ["sin(", "cos(", "tan(", "sqrt(", "log(", "log10(", "exp(", "abs("]
-
-op_cols = st.columns(len(ops))
-for c, (label, to_append) in zip(op_cols, ops):
-    if c.button(label):
-        st.session_state.expr_input = st.session_state.get("expr_input", "") + to_append
+    compute = st.button("Compute")
 
-func_cols = st.columns(len(funcs))
-for c, label in zip(func_cols, funcs):
-    if c.button(label):
-        st.session_state.expr_input = st.session_state.get("expr_input", "") + label
-
-# keyboard 'Enter' also triggers, but we handle evaluate when user clicks Calculate or presses Enter:
-evaluate = st.button("Evaluate")  # duplicate main action (convenience)
-
-if st.session_state.get("expr_input", "").strip() and (st.session_state.get("_button") or evaluate):
-    # this branch won't be used because we didn't set _button; instead evaluate on below click handling
-    pass
-
-# Evaluate when user clicks either "Calculate" or "Evaluate" or presses Enter (i.e. text_input changed with key)
-# Because streamlit re-runs top to bottom, detect button press via st.session_state from buttons:
-# Simple approach: if either of the two buttons was pressed in this run, evaluate:
-if st.button("Compute (perform evaluation)"):
-    # additional compute button to ensure response on click
-    pass
-
-# To reliably capture the "Calculate" or "Evaluate" press, inspect streamlit's runtime:
-# We'll evaluate if either button was clicked (clicked status returned above)
-# But since the previous button() calls returned values that were not stored, re-create buttons with state:
-# Simpler approach: provide an explicit "Compute" button at end and use that.
-compute = st.button("Compute")
+# Quick-operation buttons (append to expression). The pad lives in a form so a
+# press triggers a single rerun; the callback updates the input before it.
+with st.form("pad", clear_on_submit=False):
+    for c, (label, to_append) in zip(st.columns(len(_PAD_OPS)), _PAD_OPS):
+        c.form_submit_button(label, on_click=_append_to_input, args=(to_append,))
+    for c, label in zip(st.columns(len(_PAD_FUNCS)), _PAD_FUNCS):
+        c.form_submit_button(label, on_click=_append_to_input, args=(label,))
 
 if compute:
     expression = st.session_state.get("expr_input", "").strip()
@@ -237,7 +446,7 @@ if compute:
         st.warning("Please enter an expression.")
     else:
         try:
-            result = safe_eval(expression)
+            result = _cached_eval(expression)
             # Format result: show ints without .0 when appropriate
             if isinstance(result, float):
                 # show up to 12 significant digits to avoid long floats
@@ -245,31 +454,23 @@ if compute:
             else:
                 result_display = result
             st.success(f"{expression} = {result_display}")
-            st.session_state.history.insert(0, (expression, result_display))
+            st.session_state.history.appendleft((expression, result_display))
         except EvalError as ee:
             st.error(f"Error: {ee}")
-            st.session_state.history.insert(0, (expression, f"Error: {ee}"))
+            st.session_state.history.appendleft((expression, f"Error: {ee}"))
         except Exception as e:
             st.error(f"Unexpected error: {e}")
-            st.session_state.history.insert(0, (expression, f"Error: {e}"))
-
-# Provide a compact evaluator that runs when user presses Enter in the text_input:
-# Detect change compared to previous expression in session_state
-prev_expr = st.session_state.get("_prev_expr", "")
-current_expr = st.session_state.get("expr_input", "")
-if current_expr != prev_expr:
-    # update prev expr
-    st.session_state["_prev_expr"] = current_expr
-    # If the user cleared or typed a new expression, do not auto-evaluate.
-    # To avoid surprising evaluations, we won't auto-evaluate on typing; user must press Compute.
+            st.session_state.history.appendleft((expression, f"Error: {e}"))
 
 # History panel
 st.markdown("---")
 st.subheader("History")
 if st.session_state.history:
-    # show last 12 entries
-    for i, (e, r) in enumerate(st.session_state.history[:12], start=1):
-        st.write(f"**{i}.** `{e}`  →  `{r}`")
+    # show last 12 entries as one Markdown block (hard line breaks between entries)
+    st.markdown("  \n".join(
+        f"**{i}.** `{e}`  →  `{r}`"
+        for i, (e, r) in enumerate(itertools.islice(st.session_state.history, 0, 12), start=1)
+    ))
 else:
     st.write("No history yet. Evaluate an expression to see it appear here.")
 
@@ -277,7 +478,7 @@ else:
 hcol1, hcol2, hcol3 = st.columns([1,1,1])
 with hcol1:
     if st.button("Clear history"):
-        st.session_state.history = []
+        st.session_state.history.clear()
 with hcol2:
     if st.session_state.history:
         last_expr, last_res = st.session_state.history[0]
@@ -292,11 +493,7 @@ with hcol3:
 # Reference panel
 st.markdown("---")
 st.subheader("Reference / Allowed functions")
-st.write(
-    "You may use numbers, `+ - * / ^ % //` and parentheses. Use math functions like "
-    + ", ".join(sorted(_MATH_FUNCS.keys()))
-    + ". Constants: " + ", ".join(sorted(_CONSTANTS.keys()))
-)
+st.write(_REFERENCE_TEXT)
 st.caption("Examples: `2+2`, `3*sin(pi/4)`, `sqrt(16)`, `log(100,10)`, `2^8`, `factorial(5)`")
 
 # Footer small help